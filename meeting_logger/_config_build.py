@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+
+def build_config(mapping: Mapping[str, Any]):
+    """Build a PipelineConfig from keyword values shared by the CLI and GUI.
+
+    Entries set to None are dropped so the dataclass defaults apply.
+    """
+    from pipeline import PipelineConfig
+
+    return PipelineConfig(**{key: value for key, value in mapping.items() if value is not None})
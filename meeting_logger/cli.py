@@ -2,19 +2,23 @@ from __future__ import annotations
 
 import argparse
 import os
+import sys
 from pathlib import Path
+from typing import List
 
-from rich.console import Console
-from dotenv import load_dotenv
+_console_instance = None
 
-from pipeline import PipelineConfig, run_pipeline
 
-console = Console()
-load_dotenv()
+def _console():
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
 
+        _console_instance = Console()
+    return _console_instance
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Generate Plaud-style meeting notes from Craig recordings.")
+
+def _add_core_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--audio_dir", required=True, help="Folder containing per-speaker audio files")
     parser.add_argument("--project", default=None, help="Project name for Notion property")
     parser.add_argument("--meeting", default=None, help="Meeting title (leave blank to auto-generate)")
@@ -25,39 +29,94 @@ def main() -> None:
     parser.add_argument("--upload_notion", action="store_true", help="Upload results to Notion")
     parser.add_argument("--no_summarise", action="store_true", help="Skip OpenAI summarisation")
     parser.add_argument("--no_notion", action="store_true", help="Skip Notion upload")
+
+
+_RESEARCH_FLAGS = (
+    "--enable_research",
+    "--research_provider",
+    "--research_api_key",
+    "--research_triggers",
+    "--research_verbs",
+)
+
+
+def _research_requested(argv: List[str]) -> bool:
+    # Treat argparse's prefix abbreviations (e.g. --enable) like the full names.
+    for arg in argv:
+        if arg == "--":
+            break
+        if not arg.startswith("--"):
+            continue
+        flag = arg.split("=", 1)[0]
+        if any(name.startswith(flag) for name in _RESEARCH_FLAGS):
+            return True
+    return False
+
+
+def _add_research_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--enable_research", action="store_true", help="Enable research requests")
     parser.add_argument("--research_provider", default=None, help="Research provider (none/tavily)")
     parser.add_argument("--research_api_key", default=None, help="Research provider API key")
     parser.add_argument("--research_triggers", default=None, help="Comma-separated trigger words")
     parser.add_argument("--research_verbs", default=None, help="Comma-separated verbs")
 
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate Plaud-style meeting notes from Craig recordings.")
+    _add_core_args(parser)
+
+    # Only build the research group when a research flag is actually present.
+    if _research_requested(sys.argv[1:]):
+        _add_research_args(parser)
+    else:
+        parser.set_defaults(
+            enable_research=False,
+            research_provider=None,
+            research_api_key=None,
+            research_triggers=None,
+            research_verbs=None,
+        )
+
     args = parser.parse_args()
 
+    # Heavy imports (whisper/torch/openai/notion) are deferred until after
+    # argument parsing so `--help` and usage errors stay fast.
+    from dotenv import find_dotenv, load_dotenv
+
+    from _config_build import build_config
+    from pipeline import run_pipeline
+    from research.researcher import build_command_re
+
+    env_path = find_dotenv()
+    if env_path:
+        load_dotenv(env_path)
+
     triggers = [t.strip() for t in args.research_triggers.split(",") if t.strip()] if args.research_triggers else None
     verbs = [v.strip() for v in args.research_verbs.split(",") if v.strip()] if args.research_verbs else None
 
-    config = PipelineConfig(
-        audio_dir=Path(args.audio_dir),
-        project=args.project,
-        meeting_title=args.meeting,
-        date_override=args.date,
-        chunk_minutes=args.chunk_minutes,
-        model=args.model,
-        recording_url=args.recording_url,
-        upload_notion=args.upload_notion,
-        summarise=not args.no_summarise,
-        notion_enabled=not args.no_notion,
-        enable_research=args.enable_research,
-        research_provider=args.research_provider or os.getenv("RESEARCH_PROVIDER"),
-        research_api_key=args.research_api_key or os.getenv("TAVILY_API_KEY"),
-        research_triggers=triggers,
-        research_verbs=verbs,
-    )
+    config = build_config({
+        "audio_dir": Path(args.audio_dir),
+        "project": args.project,
+        "meeting_title": args.meeting,
+        "date_override": args.date,
+        "chunk_minutes": args.chunk_minutes,
+        "model": args.model,
+        "recording_url": args.recording_url,
+        "upload_notion": args.upload_notion,
+        "summarise": not args.no_summarise,
+        "notion_enabled": not args.no_notion,
+        "enable_research": args.enable_research,
+        "research_provider": args.research_provider or os.getenv("RESEARCH_PROVIDER"),
+        "research_api_key": args.research_api_key or os.getenv("TAVILY_API_KEY"),
+        "research_triggers": triggers,
+        "research_verbs": verbs,
+        "research_command_re": build_command_re(triggers, verbs),
+    })
 
     try:
-        run_pipeline(config, logger=console.print)
+        run_pipeline(config, logger=lambda message: _console().print(message))
     except Exception as exc:
-        console.print(f"[red]Error:[/red] {exc}")
+        _console().print(f"[red]Error:[/red] {exc}")
 
 
 if __name__ == "__main__":
@@ -1,15 +1,72 @@
 from __future__ import annotations
 
+import collections
+import functools
+import io
+import multiprocessing
 import os
+import queue
+import subprocess
+import sys
 import threading
 import time
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, ttk, messagebox
 
-from pipeline import PipelineConfig, run_pipeline
 from utils.date_utils import determine_date, format_date
 
+MAX_LOG_LINES = 2000
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_determine_date(path_str: str, mtime_ns: int) -> str:
+    # mtime_ns is only part of the key: adding/removing files bumps it and invalidates the entry.
+    return format_date(determine_date(None, Path(path_str)))
+
+
+def _row(parent: tk.Misc, row: int, label: str, var: tk.Variable | None = None, **kw) -> ttk.Entry:
+    ttk.Label(parent, text=label).grid(row=row, column=0, sticky="w", padx=6, pady=6)
+    if var is not None:
+        kw["textvariable"] = var
+    entry = ttk.Entry(parent, **kw)
+    entry.grid(row=row, column=1, sticky="w", padx=6, pady=6)
+    return entry
+
+
+def _pipeline_worker(jobs, events, cancel_event) -> None:
+    # Runs in a child process so whisper/torch never load into, or hold the GIL of,
+    # the Tk process. It is started with the app, imports the pipeline while the user
+    # fills in the form, and then serves every Run, so loaded models stay cached.
+    load_error: str | None = None
+    try:
+        from _config_build import build_config
+        from pipeline import run_pipeline
+        from research.researcher import build_command_re
+    except Exception as exc:
+        load_error = str(exc)
+
+    for mapping in iter(jobs.get, None):
+        if load_error is not None:
+            events.put(("error", load_error))
+            continue
+        try:
+            config = build_config({
+                **mapping,
+                "research_command_re": build_command_re(mapping["research_triggers"], mapping["research_verbs"]),
+            })
+            result = run_pipeline(
+                config,
+                logger=lambda message: events.put(("log", message)),
+                progress_cb=lambda current, total, speaker, duration: events.put(
+                    ("progress", current, total, speaker, duration)
+                ),
+                cancel_cb=cancel_event.is_set,
+            )
+            events.put(("done", result))
+        except Exception as exc:
+            events.put(("error", str(exc)))
+
 
 class MeetingLoggerApp:
     def __init__(self, root: tk.Tk) -> None:
@@ -19,12 +76,41 @@ class MeetingLoggerApp:
 
         self.base_dir = Path(__file__).resolve().parent
         self.env_path = self.base_dir / ".env"
+        self.outputs_path = self.base_dir / "outputs"
+        self.outputs_path.mkdir(exist_ok=True)
+        self._date_request = 0
+        self._log_queue: collections.deque[str] = collections.deque(maxlen=5000)
+        self._log_pending = False
+        self.log_text: tk.Text | None = None
+        self._env_loaded = False
+
+        # Status/progress updates from worker threads are coalesced and applied
+        # by a periodic flusher instead of one Tk event per callback.
+        self._ui_lock = threading.Lock()
+        self._pending_status: str | None = None
+        self._pending_progress: tuple[int, int] | None = None
 
         self._build_ui()
-        self._load_env()
+
+        self._start_worker()
+
+        self.root.after(100, self._flush_ui)
+
+    def _start_worker(self) -> None:
+        # spawn, not fork: forking a live Tk process with running threads is unsafe.
+        ctx = multiprocessing.get_context("spawn")
+        self._jobs: multiprocessing.Queue = ctx.Queue()
+        self._events: multiprocessing.Queue = ctx.Queue()
+        self._cancel_flag = ctx.Event()
+        self._worker = ctx.Process(
+            target=_pipeline_worker,
+            args=(self._jobs, self._events, self._cancel_flag),
+            daemon=True,
+        )
+        self._worker.start()
 
     def _build_ui(self) -> None:
-        notebook = ttk.Notebook(self.root)
+        notebook = self.notebook = ttk.Notebook(self.root)
         notebook.pack(fill="both", expand=True, padx=10, pady=10)
 
         self.main_frame = ttk.Frame(notebook)
@@ -35,9 +121,33 @@ class MeetingLoggerApp:
         notebook.add(self.settings_frame, text="Settings")
         notebook.add(self.log_frame, text="Log")
 
+        self._init_settings_vars()
         self._build_main_tab()
-        self._build_settings_tab()
-        self._build_log_tab()
+
+        # Settings and Log widgets are only built the first time their tab is shown.
+        self._tab_builders = {
+            self.settings_frame: self._build_settings_tab,
+            self.log_frame: self._build_log_tab,
+        }
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab)
+
+    def _on_tab(self, _event: tk.Event) -> None:
+        builder = self._tab_builders.pop(self.notebook.nametowidget(self.notebook.select()), None)
+        if builder:
+            builder()
+
+    def _init_settings_vars(self) -> None:
+        # Run reads these even if the Settings tab was never opened.
+        self.openai_key_var = tk.StringVar()
+        self.openai_model_var = tk.StringVar(value="gpt-5-pro")
+        self.openai_fallback_var = tk.StringVar(value="gpt-5")
+        self.notion_token_var = tk.StringVar()
+        self.notion_db_var = tk.StringVar()
+        self.research_provider_var = tk.StringVar(value="none")
+        self.research_api_key_var = tk.StringVar()
+        self.research_triggers_var = tk.StringVar(value="craig,quag,crag,graig")
+        self.research_verbs_var = tk.StringVar(value="google,search,research,find,lookup,look up,check")
+        self.log_max_lines_var = tk.IntVar(value=MAX_LOG_LINES)
 
     def _build_main_tab(self) -> None:
         frame = self.main_frame
@@ -46,10 +156,6 @@ class MeetingLoggerApp:
         audio_frame.pack(fill="x", padx=10, pady=10)
 
         self.audio_dir_var = tk.StringVar()
-        self.meeting_title_var = tk.StringVar()
-        self.project_var = tk.StringVar()
-        self.date_override_var = tk.StringVar()
-        self.recording_url_var = tk.StringVar()
         self.auto_date_var = tk.StringVar(value="Auto date: ")
 
         ttk.Label(audio_frame, text="Audio folder").grid(row=0, column=0, sticky="w", padx=6, pady=6)
@@ -59,17 +165,11 @@ class MeetingLoggerApp:
 
         ttk.Label(audio_frame, textvariable=self.auto_date_var).grid(row=1, column=1, sticky="w", padx=6)
 
-        ttk.Label(audio_frame, text="Meeting title (blank = auto)").grid(row=2, column=0, sticky="w", padx=6, pady=6)
-        ttk.Entry(audio_frame, textvariable=self.meeting_title_var, width=60).grid(row=2, column=1, sticky="w", padx=6, pady=6)
-
-        ttk.Label(audio_frame, text="Project").grid(row=3, column=0, sticky="w", padx=6, pady=6)
-        ttk.Entry(audio_frame, textvariable=self.project_var, width=40).grid(row=3, column=1, sticky="w", padx=6, pady=6)
-
-        ttk.Label(audio_frame, text="Date override (YYYY-MM-DD)").grid(row=4, column=0, sticky="w", padx=6, pady=6)
-        ttk.Entry(audio_frame, textvariable=self.date_override_var, width=20).grid(row=4, column=1, sticky="w", padx=6, pady=6)
-
-        ttk.Label(audio_frame, text="Recording URL").grid(row=5, column=0, sticky="w", padx=6, pady=6)
-        ttk.Entry(audio_frame, textvariable=self.recording_url_var, width=60).grid(row=5, column=1, sticky="w", padx=6, pady=6)
+        # Read once at Run time, so these entries skip a backing Tcl variable.
+        self.meeting_title_entry = _row(audio_frame, 2, "Meeting title (blank = auto)", width=60)
+        self.project_entry = _row(audio_frame, 3, "Project", width=40)
+        self.date_override_entry = _row(audio_frame, 4, "Date override (YYYY-MM-DD)", width=20)
+        self.recording_url_entry = _row(audio_frame, 5, "Recording URL", width=60)
 
         processing_frame = ttk.LabelFrame(frame, text="Processing")
         processing_frame.pack(fill="x", padx=10, pady=10)
@@ -124,30 +224,11 @@ class MeetingLoggerApp:
         creds_frame = ttk.LabelFrame(frame, text="Credentials")
         creds_frame.pack(fill="x", padx=10, pady=10)
 
-        self.openai_key_var = tk.StringVar()
-        self.openai_model_var = tk.StringVar(value="gpt-5-pro")
-        self.openai_fallback_var = tk.StringVar(value="gpt-5")
-        self.notion_token_var = tk.StringVar()
-        self.notion_db_var = tk.StringVar()
-        self.research_provider_var = tk.StringVar(value="none")
-        self.research_api_key_var = tk.StringVar()
-        self.research_triggers_var = tk.StringVar(value="craig,quag,crag,graig")
-        self.research_verbs_var = tk.StringVar(value="google,search,research,find,lookup,look up,check")
-
-        ttk.Label(creds_frame, text="OpenAI API key").grid(row=0, column=0, sticky="w", padx=6, pady=6)
-        ttk.Entry(creds_frame, textvariable=self.openai_key_var, width=60, show="*").grid(row=0, column=1, sticky="w", padx=6, pady=6)
-
-        ttk.Label(creds_frame, text="OpenAI model").grid(row=1, column=0, sticky="w", padx=6, pady=6)
-        ttk.Entry(creds_frame, textvariable=self.openai_model_var, width=20).grid(row=1, column=1, sticky="w", padx=6, pady=6)
-
-        ttk.Label(creds_frame, text="OpenAI fallback model").grid(row=2, column=0, sticky="w", padx=6, pady=6)
-        ttk.Entry(creds_frame, textvariable=self.openai_fallback_var, width=20).grid(row=2, column=1, sticky="w", padx=6, pady=6)
-
-        ttk.Label(creds_frame, text="Notion token").grid(row=3, column=0, sticky="w", padx=6, pady=6)
-        ttk.Entry(creds_frame, textvariable=self.notion_token_var, width=60, show="*").grid(row=3, column=1, sticky="w", padx=6, pady=6)
-
-        ttk.Label(creds_frame, text="Notion database ID").grid(row=4, column=0, sticky="w", padx=6, pady=6)
-        ttk.Entry(creds_frame, textvariable=self.notion_db_var, width=60).grid(row=4, column=1, sticky="w", padx=6, pady=6)
+        _row(creds_frame, 0, "OpenAI API key", self.openai_key_var, width=60, show="*")
+        _row(creds_frame, 1, "OpenAI model", self.openai_model_var, width=20)
+        _row(creds_frame, 2, "OpenAI fallback model", self.openai_fallback_var, width=20)
+        _row(creds_frame, 3, "Notion token", self.notion_token_var, width=60, show="*")
+        _row(creds_frame, 4, "Notion database ID", self.notion_db_var, width=60)
 
         research_frame = ttk.LabelFrame(frame, text="Research")
         research_frame.pack(fill="x", padx=10, pady=10)
@@ -157,14 +238,17 @@ class MeetingLoggerApp:
             row=0, column=1, sticky="w", padx=6, pady=6
         )
 
-        ttk.Label(research_frame, text="Tavily API key").grid(row=1, column=0, sticky="w", padx=6, pady=6)
-        ttk.Entry(research_frame, textvariable=self.research_api_key_var, width=60, show="*").grid(row=1, column=1, sticky="w", padx=6, pady=6)
+        _row(research_frame, 1, "Tavily API key", self.research_api_key_var, width=60, show="*")
+        _row(research_frame, 2, "Trigger words (CSV)", self.research_triggers_var, width=60)
+        _row(research_frame, 3, "Verbs (CSV)", self.research_verbs_var, width=60)
 
-        ttk.Label(research_frame, text="Trigger words (CSV)").grid(row=2, column=0, sticky="w", padx=6, pady=6)
-        ttk.Entry(research_frame, textvariable=self.research_triggers_var, width=60).grid(row=2, column=1, sticky="w", padx=6, pady=6)
+        interface_frame = ttk.LabelFrame(frame, text="Interface")
+        interface_frame.pack(fill="x", padx=10, pady=10)
 
-        ttk.Label(research_frame, text="Verbs (CSV)").grid(row=3, column=0, sticky="w", padx=6, pady=6)
-        ttk.Entry(research_frame, textvariable=self.research_verbs_var, width=60).grid(row=3, column=1, sticky="w", padx=6, pady=6)
+        ttk.Label(interface_frame, text="Max log lines").grid(row=0, column=0, sticky="w", padx=6, pady=6)
+        ttk.Spinbox(interface_frame, from_=100, to=100000, increment=500, textvariable=self.log_max_lines_var, width=8).grid(
+            row=0, column=1, sticky="w", padx=6, pady=6
+        )
 
         action_frame = ttk.Frame(frame)
         action_frame.pack(fill="x", padx=10, pady=10)
@@ -175,27 +259,72 @@ class MeetingLoggerApp:
         note = ttk.Label(frame, text="Settings are saved to .env in the meeting_logger folder.")
         note.pack(fill="x", padx=10)
 
+        if not self._env_loaded:
+            self._load_env()
+
     def _build_log_tab(self) -> None:
         self.log_text = tk.Text(self.log_frame, height=20, wrap="word")
         self.log_text.pack(fill="both", expand=True, padx=10, pady=10)
         self.log_text.configure(state="disabled")
-
-    def _append_log(self, message: str) -> None:
-        self.log_text.configure(state="normal")
-        self.log_text.insert("end", message + "\n")
-        self.log_text.see("end")
-        self.log_text.configure(state="disabled")
+        self._schedule_log_flush()
 
     def _log(self, message: str) -> None:
         if message.startswith("STATUS:"):
-            status = message.split("STATUS:", 1)[1].strip()
-            self._set_status(status)
-        self.root.after(0, self._append_log, message)
+            self._set_status(message[7:].strip())
+        self._log_queue.append(message)
+        self._schedule_log_flush()
+
+    def _schedule_log_flush(self) -> None:
+        if not self._log_pending:
+            self._log_pending = True
+            self.root.after(80, self._flush_logs)
+
+    def _flush_logs(self) -> None:
+        self._log_pending = False
+        if self.log_text is None:
+            return  # Kept queued until the Log tab is first opened.
+        popleft = self._log_queue.popleft
+        batch: list[str] = []
+        while True:
+            try:
+                batch.append(popleft())
+            except IndexError:
+                break
+        if not batch:
+            return
+        # Talk to Tcl directly; the tkinter wrappers add per-call option parsing.
+        call = self.log_text.tk.call
+        widget = str(self.log_text)
+        call(widget, "configure", "-state", tk.NORMAL)
+        call(widget, "insert", "end", "\n".join(batch) + "\n")
+        line_count = int(str(call(widget, "index", "end-1c")).split(".")[0])
+        max_lines = self._log_max_lines()
+        if line_count > max_lines:
+            call(widget, "delete", "1.0", f"{line_count - max_lines}.0")
+        call(widget, "see", "end")
+        call(widget, "configure", "-state", tk.DISABLED)
+
+    def _log_max_lines(self) -> int:
+        try:
+            return max(1, int(self.log_max_lines_var.get()))
+        except (tk.TclError, ValueError):
+            return MAX_LOG_LINES
 
     def _set_status(self, status: str) -> None:
-        def apply() -> None:
+        with self._ui_lock:
+            self._pending_status = status
+
+    def _flush_ui(self) -> None:
+        with self._ui_lock:
+            status, self._pending_status = self._pending_status, None
+            progress, self._pending_progress = self._pending_progress, None
+        if progress is not None:
+            current, total = progress
+            self.progress.stop()
+            self.progress.configure(mode="determinate", maximum=total, value=current)
+        if status is not None:
             self.status_var.set(status)
-        self.root.after(0, apply)
+        self.root.after(100, self._flush_ui)
 
     def _browse_audio(self) -> None:
         folder = filedialog.askdirectory(title="Select audio folder")
@@ -205,28 +334,51 @@ class MeetingLoggerApp:
 
     def _update_auto_date(self) -> None:
         audio_dir = Path(self.audio_dir_var.get()).expanduser()
-        if audio_dir.exists():
-            date = determine_date(None, audio_dir)
-            self.auto_date_var.set(f"Auto date: {format_date(date)}")
-        else:
-            self.auto_date_var.set("Auto date: ")
+        self._date_request += 1
+        token = self._date_request
+        self.auto_date_var.set("Auto date: …")
+
+        def worker() -> None:
+            try:
+                text = self._compute_date_blocking(audio_dir)
+            except OSError:
+                text = "Auto date: "
+
+            def apply() -> None:
+                # A newer Browse may have superseded this lookup.
+                if token == self._date_request:
+                    self.auto_date_var.set(text)
+            self.root.after(0, apply)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _compute_date_blocking(self, audio_dir: Path) -> str:
+        try:
+            mtime_ns = audio_dir.stat().st_mtime_ns
+        except OSError:
+            return "Auto date: "
+        return f"Auto date: {_cached_determine_date(str(audio_dir), mtime_ns)}"
 
     def _open_outputs(self) -> None:
-        outputs_path = self.base_dir / "outputs"
-        outputs_path.mkdir(exist_ok=True)
-        os.startfile(outputs_path)  # type: ignore[attr-defined]
+        path = str(self.outputs_path)
+        cmd = {"win32": ["explorer", path], "darwin": ["open", path]}.get(sys.platform, ["xdg-open", path])
+        try:
+            subprocess.Popen(cmd, close_fds=True)
+        except OSError as exc:
+            self._log(f"Could not open outputs folder: {exc}")
 
     def _load_env(self) -> None:
-        if not self.env_path.exists():
+        self._env_loaded = True
+        try:
+            text = self.env_path.read_text(encoding="utf-8")
+        except OSError:
             return
-        data = {}
-        for line in self.env_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" in line:
-                key, value = line.split("=", 1)
-                data[key.strip()] = value.strip()
+        from dotenv import dotenv_values
+
+        # Values are written back verbatim by _save_env, so skip ${VAR} interpolation.
+        # Keys declared without a value come back as None; treat them as unset.
+        parsed = dotenv_values(stream=io.StringIO(text), interpolate=False)
+        data = {key: value for key, value in parsed.items() if value is not None}
 
         self.openai_key_var.set(data.get("OPENAI_API_KEY", ""))
         self.openai_model_var.set(data.get("OPENAI_MODEL", "gpt-5-pro"))
@@ -237,20 +389,26 @@ class MeetingLoggerApp:
         self.research_api_key_var.set(data.get("TAVILY_API_KEY", ""))
         self.research_triggers_var.set(data.get("RESEARCH_TRIGGERS", "craig,quag,crag,graig"))
         self.research_verbs_var.set(data.get("RESEARCH_VERBS", "google,search,research,find,lookup,look up,check"))
+        self.log_max_lines_var.set(data.get("LOG_MAX_LINES", MAX_LOG_LINES))
 
     def _save_env(self) -> None:
-        lines = [
-            f"OPENAI_API_KEY={self.openai_key_var.get().strip()}",
-            f"OPENAI_MODEL={self.openai_model_var.get().strip() or 'gpt-5-pro'}",
-            f"OPENAI_MODEL_FALLBACK={self.openai_fallback_var.get().strip() or 'gpt-5'}",
-            f"NOTION_TOKEN={self.notion_token_var.get().strip()}",
-            f"NOTION_DATABASE_ID={self.notion_db_var.get().strip()}",
-            f"RESEARCH_PROVIDER={self.research_provider_var.get().strip() or 'none'}",
-            f"TAVILY_API_KEY={self.research_api_key_var.get().strip()}",
-            f"RESEARCH_TRIGGERS={self.research_triggers_var.get().strip()}",
-            f"RESEARCH_VERBS={self.research_verbs_var.get().strip()}",
-        ]
-        self.env_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        pairs = (
+            ("OPENAI_API_KEY", self.openai_key_var.get().strip()),
+            ("OPENAI_MODEL", self.openai_model_var.get().strip() or "gpt-5-pro"),
+            ("OPENAI_MODEL_FALLBACK", self.openai_fallback_var.get().strip() or "gpt-5"),
+            ("NOTION_TOKEN", self.notion_token_var.get().strip()),
+            ("NOTION_DATABASE_ID", self.notion_db_var.get().strip()),
+            ("RESEARCH_PROVIDER", self.research_provider_var.get().strip() or "none"),
+            ("TAVILY_API_KEY", self.research_api_key_var.get().strip()),
+            ("RESEARCH_TRIGGERS", self.research_triggers_var.get().strip()),
+            ("RESEARCH_VERBS", self.research_verbs_var.get().strip()),
+            ("LOG_MAX_LINES", str(self._log_max_lines())),
+        )
+        # Write to a sibling temp file and swap it in so readers never see a partial .env.
+        tmp_path = self.env_path.with_name(self.env_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            f.writelines(f"{key}={value}\n" for key, value in pairs)
+        os.replace(tmp_path, self.env_path)
         messagebox.showinfo("Saved", ".env saved successfully.")
 
     def _run_pipeline(self) -> None:
@@ -259,30 +417,35 @@ class MeetingLoggerApp:
             messagebox.showerror("Missing audio folder", "Please select an audio folder.")
             return
 
+        if not self._env_loaded:
+            self._load_env()
+
         triggers = [t.strip() for t in self.research_triggers_var.get().split(",") if t.strip()]
         verbs = [v.strip() for v in self.research_verbs_var.get().split(",") if v.strip()]
 
-        config = PipelineConfig(
-            audio_dir=Path(audio_dir),
-            project=self.project_var.get().strip() or None,
-            meeting_title=self.meeting_title_var.get().strip() or None,
-            date_override=self.date_override_var.get().strip() or None,
-            chunk_minutes=int(self.chunk_minutes_var.get()),
-            model=self.model_var.get().strip() or "small",
-            recording_url=self.recording_url_var.get().strip() or None,
-            upload_notion=self.upload_notion_var.get(),
-            summarise=self.summarise_var.get(),
-            notion_enabled=True,
-            openai_api_key=self.openai_key_var.get().strip() or None,
-            openai_model=self.openai_model_var.get().strip() or None,
-            notion_token=self.notion_token_var.get().strip() or None,
-            notion_database_id=self.notion_db_var.get().strip() or None,
-            enable_research=self.enable_research_var.get(),
-            research_provider=self.research_provider_var.get().strip() or None,
-            research_api_key=self.research_api_key_var.get().strip() or None,
-            research_triggers=triggers or None,
-            research_verbs=verbs or None,
-        )
+        # A plain dict: the worker builds the PipelineConfig, so pipeline is never
+        # imported by the Tk process.
+        job = {
+            "audio_dir": Path(audio_dir),
+            "project": self.project_entry.get().strip() or None,
+            "meeting_title": self.meeting_title_entry.get().strip() or None,
+            "date_override": self.date_override_entry.get().strip() or None,
+            "chunk_minutes": int(self.chunk_minutes_var.get()),
+            "model": self.model_var.get().strip() or "small",
+            "recording_url": self.recording_url_entry.get().strip() or None,
+            "upload_notion": self.upload_notion_var.get(),
+            "summarise": self.summarise_var.get(),
+            "notion_enabled": True,
+            "openai_api_key": self.openai_key_var.get().strip() or None,
+            "openai_model": self.openai_model_var.get().strip() or None,
+            "notion_token": self.notion_token_var.get().strip() or None,
+            "notion_database_id": self.notion_db_var.get().strip() or None,
+            "enable_research": self.enable_research_var.get(),
+            "research_provider": self.research_provider_var.get().strip() or None,
+            "research_api_key": self.research_api_key_var.get().strip() or None,
+            "research_triggers": triggers or None,
+            "research_verbs": verbs or None,
+        }
 
         self.run_button.configure(state="disabled")
         self.cancel_button.configure(state="normal")
@@ -291,52 +454,76 @@ class MeetingLoggerApp:
         self.progress.start(10)
         self._log("Starting pipeline...")
 
+        if not self._worker.is_alive():
+            self._start_worker()
+        process, events = self._worker, self._events
+        self._cancel_flag.clear()
+        self._jobs.put(job)
+
         start_time = time.time()
-        self._cancel_flag = threading.Event()
-        durations: list[float] = []
+        self._eta_count = 0
 
         def progress_cb(current: int, total: int, speaker: str, duration: float | None) -> None:
-            def apply() -> None:
-                if duration:
-                    durations.append(duration)
-                if durations:
-                    avg_seconds = (time.time() - start_time) / max(1, len(durations))
-                    remaining = max(0, total - current)
-                    eta_min = int((avg_seconds * remaining) / 60)
-                    eta_text = f"~{eta_min} min left" if eta_min >= 1 else "<1 min left"
-                else:
-                    eta_text = ""
-                self.progress.stop()
-                self.progress.configure(mode="determinate", maximum=total, value=current)
-                self.status_var.set(f"Transcribing {speaker} ({current}/{total}) {eta_text}".strip())
-            self.root.after(0, apply)
-
-        def worker() -> None:
-            try:
-                result = run_pipeline(
-                    config,
-                    logger=self._log,
-                    progress_cb=progress_cb,
-                    cancel_cb=self._cancel_flag.is_set,
-                )
-                self._log(f"Done. Notes saved to {result.get('markdown_path')}")
-                if result.get("notion_url"):
-                    self._log(f"Notion page: {result.get('notion_url')}")
-            except Exception as exc:
-                self._log(f"Error: {exc}")
-            finally:
-                def finish() -> None:
-                    self.progress.stop()
-                    self.progress.configure(mode="determinate", maximum=100, value=100)
-                    self.status_var.set("Idle")
-                    self.run_button.configure(state="normal")
-                    self.cancel_button.configure(state="disabled")
-                self.root.after(0, finish)
-
-        threading.Thread(target=worker, daemon=True).start()
+            if duration:
+                self._eta_count += 1
+            # Always store the latest values; _flush_ui applies them to Tk at 10 Hz.
+            if self._eta_count:
+                avg_seconds = (time.time() - start_time) / self._eta_count
+                remaining = max(0, total - current)
+                eta_min = int((avg_seconds * remaining) / 60)
+                eta_text = f"~{eta_min} min left" if eta_min >= 1 else "<1 min left"
+            else:
+                eta_text = ""
+            with self._ui_lock:
+                self._pending_progress = (current, total)
+                self._pending_status = f"Transcribing {speaker} ({current}/{total}) {eta_text}".strip()
+
+        def finish() -> None:
+            with self._ui_lock:
+                self._pending_status = None
+                self._pending_progress = None
+            self.progress.stop()
+            self.progress.configure(mode="determinate", maximum=100, value=100)
+            self.status_var.set("Idle")
+            self.run_button.configure(state="normal")
+            self.cancel_button.configure(state="disabled")
+
+        def handle_events() -> bool:
+            while True:
+                try:
+                    event = events.get_nowait()
+                except queue.Empty:
+                    return False
+                kind = event[0]
+                if kind == "log":
+                    self._log(event[1])
+                elif kind == "progress":
+                    progress_cb(*event[1:])
+                elif kind == "done":
+                    result = event[1]
+                    self._log(f"Done. Notes saved to {result.get('markdown_path')}")
+                    if result.get("notion_url"):
+                        self._log(f"Notion page: {result.get('notion_url')}")
+                    return True
+                elif kind == "error":
+                    self._log(f"Error: {event[1]}")
+                    return True
+
+        def drain() -> None:
+            alive = process.is_alive()
+            if handle_events():
+                finish()
+            elif not alive:
+                # Exited without reporting back (e.g. crashed); Run starts a new worker.
+                self._log(f"Error: pipeline process exited with code {process.exitcode}")
+                finish()
+            else:
+                self.root.after(50, drain)
+
+        self.root.after(50, drain)
 
     def _cancel_run(self) -> None:
-        if hasattr(self, "_cancel_flag"):
+        if self._worker.is_alive():
             self._cancel_flag.set()
             self._log("Cancel requested. Finishing current file...")
             self._set_status("Cancelling")
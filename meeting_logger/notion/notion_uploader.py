@@ -1,11 +1,63 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import atexit
+import itertools
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from notion_client import Client
+import httpx
+from notion_client import APIErrorCode, APIResponseError, Client
 
 from utils.chunking import chunk_text
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+class _OrjsonHttpClient(httpx.Client):
+    # Handed to the SDK via Client(client=...), so requests still go through its
+    # request() path (retry/backoff, error mapping); only body encoding changes.
+    def build_request(self, method: str, url: Any, *, json: Any = None, **kwargs: Any) -> httpx.Request:
+        if json is not None:
+            headers = httpx.Headers(kwargs.pop("headers", None))
+            headers["Content-Type"] = "application/json"
+            return super().build_request(method, url, content=orjson.dumps(json), headers=headers, **kwargs)
+        return super().build_request(method, url, **kwargs)
+
+# One client per token so repeated uploads reuse the pooled keep-alive connection.
+_NOTION_CLIENTS: Dict[str, Client] = {}
+
+
+def _get_client(token: str) -> Client:
+    client = _NOTION_CLIENTS.get(token)
+    if client is None:
+        http_client = _OrjsonHttpClient() if orjson is not None else None
+        client = _NOTION_CLIENTS[token] = Client(auth=token, client=http_client)
+    return client
+
+
+# database_id -> (fetched_at, database object); schemas rarely change mid-session.
+_DB_SCHEMA_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_DB_SCHEMA_TTL_SECONDS = 600.0
+
+
+def _get_database(notion: Client, database_id: str) -> Tuple[Dict[str, Any], bool]:
+    fetched_at, db = _DB_SCHEMA_CACHE.get(database_id, (0.0, None))
+    if db is not None and time.monotonic() - fetched_at < _DB_SCHEMA_TTL_SECONDS:
+        return db, True
+    db = notion.databases.retrieve(database_id=database_id)
+    _DB_SCHEMA_CACHE[database_id] = (time.monotonic(), db)
+    return db, False
+
+
+@atexit.register
+def _close_clients() -> None:
+    for client in _NOTION_CLIENTS.values():
+        client.close()
+    _NOTION_CLIENTS.clear()
+
 
 def _rich_text(text: str, bold: bool = False) -> List[Dict[str, Any]]:
     if text is None:
@@ -19,65 +71,109 @@ def _rich_text(text: str, bold: bool = False) -> List[Dict[str, Any]]:
     ]
 
 
-def _heading(text: str) -> Dict[str, Any]:
+def _block(kind: str, text: str, **extra: Any) -> Dict[str, Any]:
     return {
         "object": "block",
-        "type": "heading_2",
-        "heading_2": {"rich_text": _rich_text(text)},
+        "type": kind,
+        kind: {"rich_text": _rich_text(text), **extra},
     }
 
 
+def _heading(text: str) -> Dict[str, Any]:
+    return _block("heading_2", text)
+
+
 def _paragraph(text: str) -> Dict[str, Any]:
-    return {
-        "object": "block",
-        "type": "paragraph",
-        "paragraph": {"rich_text": _rich_text(text)},
-    }
+    return _block("paragraph", text)
 
 
 def _bulleted(text: str) -> Dict[str, Any]:
-    return {
-        "object": "block",
-        "type": "bulleted_list_item",
-        "bulleted_list_item": {"rich_text": _rich_text(text)},
-    }
+    return _block("bulleted_list_item", text)
+
+
+def _bulleted_many(items: List[str]) -> List[Dict[str, Any]]:
+    # Inlined block/rich_text shape: this runs once per bullet on every section.
+    return [
+        {
+            "object": "block",
+            "type": "bulleted_list_item",
+            "bulleted_list_item": {
+                "rich_text": [
+                    {
+                        "type": "text",
+                        "text": {"content": "" if item is None else item},
+                        "annotations": {"bold": False},
+                    }
+                ]
+            },
+        }
+        for item in items
+    ]
 
 
 def _todo(text: str) -> Dict[str, Any]:
-    return {
-        "object": "block",
-        "type": "to_do",
-        "to_do": {"rich_text": _rich_text(text), "checked": False},
-    }
+    return _block("to_do", text, checked=False)
 
 
 def _callout(text: str) -> Dict[str, Any]:
-    return {
-        "object": "block",
-        "type": "callout",
-        "callout": {"rich_text": _rich_text(text)},
-    }
+    return _block("callout", text)
 
 
 def _toggle(title: str, children: List[Dict[str, Any]]) -> Dict[str, Any]:
-    return {
-        "object": "block",
-        "type": "toggle",
-        "toggle": {"rich_text": _rich_text(title), "children": children},
-    }
-
-
-def _chunk_blocks(blocks: List[Dict[str, Any]], size: int = 50) -> List[List[Dict[str, Any]]]:
-    return [blocks[i : i + size] for i in range(0, len(blocks), size)]
+    return _block("toggle", title, children=children)
+
+
+# Static blocks are shared templates; they are never mutated after creation.
+_INTRO_CALLOUT = _callout("Auto-generated meeting notes. Transcript stored below.")
+_HEADING_SUMMARY = _heading("Summary")
+_HEADING_DECISIONS = _heading("Decisions")
+_HEADING_ACTIONS = _heading("Action items")
+_HEADING_HIGHLIGHTS = _heading("Top highlights")
+_HEADING_TIMELINE = _heading("Timeline summary")
+_HEADING_RESEARCH_REQUESTS = _heading("Research requests")
+_HEADING_RESEARCH_RESULTS = _heading("Research results")
+_HEADING_TRANSCRIPT = _heading("Transcript")
+_NO_SUMMARY = _bulleted("No summary generated.")
+_NO_DECISIONS = _bulleted("No explicit decisions recorded.")
+_NO_ACTIONS = _todo("No action items captured.")
+_NO_HIGHLIGHTS = _bulleted("No highlights generated.")
+_NO_TIMELINE = _bulleted("No timeline summary generated.")
+_NO_RESEARCH_REQUESTS = _bulleted("No research requests recorded.")
+_NO_RESEARCH_RESULTS = _bulleted("No research results available.")
+
+
+def _action_text(item: Dict[str, Any]) -> str:
+    owner = item.get("owner") or "Unassigned"
+    task = item.get("task") or ""
+    due = item.get("due") or ""
+    suffix = f" (due {due})" if due else ""
+    return f"{owner} - {task}{suffix}".strip()
+
+
+def _result_blocks(item: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield _paragraph(item.get("query", ""))
+    for res in item.get("results") or ():
+        get = res.get
+        title = get("title") or "Result"
+        url = get("url") or ""
+        yield _bulleted(f"{title} {url}".strip())
+        snippet = get("snippet")
+        if snippet:
+            yield _paragraph(snippet)
+
+
+def _chunk_blocks(blocks: List[Dict[str, Any]], size: int = 50) -> Iterator[List[Dict[str, Any]]]:
+    it = iter(blocks)
+    return iter(lambda: list(itertools.islice(it, size)), [])
 
 
 def _filter_properties(db_props: Dict[str, Any], desired: Dict[str, Any]) -> Dict[str, Any]:
-    return {key: value for key, value in desired.items() if key in db_props}
+    prop_names = frozenset(db_props)
+    return {key: value for key, value in desired.items() if key in prop_names}
 
 
-def upload_to_notion(
-    token: str,
-    database_id: str,
+def _page_properties(
+    db_props: Dict[str, Any],
     title: str,
     date_str: str,
     project: Optional[str],
@@ -87,19 +183,7 @@ def upload_to_notion(
     decisions_count: int,
     status: str,
     recording_url: Optional[str],
-    summary: List[str],
-    decisions: List[str],
-    actions: List[Dict[str, Any]],
-    highlights: List[Dict[str, Any]],
-    timeline: List[Dict[str, Any]],
-    research_requests: List[Dict[str, Any]],
-    research_results: List[Dict[str, Any]],
-    transcript: str,
-) -> str:
-    notion = Client(auth=token)
-    db = notion.databases.retrieve(database_id=database_id)
-    db_props = db.get("properties", {})
-
+) -> Dict[str, Any]:
     title_prop = "Name"
     for prop_name, prop in db_props.items():
         if prop.get("type") == "title":
@@ -122,94 +206,127 @@ def upload_to_notion(
     if recording_url:
         properties["Recording"] = {"url": recording_url}
 
-    properties = _filter_properties(db_props, properties)
+    return _filter_properties(db_props, properties)
 
-    page = notion.pages.create(
-        parent={"database_id": database_id},
-        properties=properties,
-    )
-    page_id = page["id"]
 
-    blocks: List[Dict[str, Any]] = []
-    blocks.append(_callout("Auto-generated meeting notes. Transcript stored below."))
+def upload_to_notion(
+    token: str,
+    database_id: str,
+    title: str,
+    date_str: str,
+    project: Optional[str],
+    meeting_type: Optional[str],
+    attendees: List[str],
+    actions_count: int,
+    decisions_count: int,
+    status: str,
+    recording_url: Optional[str],
+    summary: List[str],
+    decisions: List[str],
+    actions: List[Dict[str, Any]],
+    highlights: List[Dict[str, Any]],
+    timeline: List[Dict[str, Any]],
+    research_requests: List[Dict[str, Any]],
+    research_results: List[Dict[str, Any]],
+    transcript: str,
+) -> str:
+    notion = _get_client(token)
+    db, from_cache = _get_database(notion, database_id)
+    page_props: Dict[str, Any] = {
+        "title": title,
+        "date_str": date_str,
+        "project": project,
+        "meeting_type": meeting_type,
+        "attendees": attendees,
+        "actions_count": actions_count,
+        "decisions_count": decisions_count,
+        "status": status,
+        "recording_url": recording_url,
+    }
+    properties = _page_properties(db.get("properties", {}), **page_props)
 
-    blocks.append(_heading("Summary"))
+    blocks: List[Dict[str, Any]] = [_INTRO_CALLOUT, _HEADING_SUMMARY]
     if summary:
-        blocks.extend([_bulleted(item) for item in summary])
+        blocks.extend(_bulleted_many(summary))
     else:
-        blocks.append(_bulleted("No summary generated."))
+        blocks.append(_NO_SUMMARY)
 
-    blocks.append(_heading("Decisions"))
+    blocks.append(_HEADING_DECISIONS)
     if decisions:
-        blocks.extend([_bulleted(item) for item in decisions])
+        blocks.extend(_bulleted_many(decisions))
     else:
-        blocks.append(_bulleted("No explicit decisions recorded."))
+        blocks.append(_NO_DECISIONS)
 
-    blocks.append(_heading("Action items"))
+    blocks.append(_HEADING_ACTIONS)
     if actions:
-        for item in actions:
-            owner = item.get("owner") or "Unassigned"
-            task = item.get("task") or ""
-            due = item.get("due") or ""
-            suffix = f" (due {due})" if due else ""
-            blocks.append(_todo(f"{owner} - {task}{suffix}".strip()))
+        blocks.extend(_todo(_action_text(item)) for item in actions)
     else:
-        blocks.append(_todo("No action items captured."))
+        blocks.append(_NO_ACTIONS)
 
-    blocks.append(_heading("Top highlights"))
+    blocks.append(_HEADING_HIGHLIGHTS)
     if highlights:
-        for item in highlights:
-            ts = item.get("ts") or ""
-            text = item.get("text") or ""
-            blocks.append(_bulleted(f"[{ts}] {text}".strip()))
+        blocks.extend(
+            _bulleted(f"[{item.get('ts') or ''}] {item.get('text') or ''}".strip()) for item in highlights
+        )
     else:
-        blocks.append(_bulleted("No highlights generated."))
+        blocks.append(_NO_HIGHLIGHTS)
 
-    blocks.append(_heading("Timeline summary"))
+    blocks.append(_HEADING_TIMELINE)
     if timeline:
         for window in timeline:
             range_label = window.get("range", "")
             label = window.get("label", "")
-            title = f"{range_label} - {label}".strip(" -")
-            blocks.append(_paragraph(title))
-            for bullet in window.get("bullets", []) or []:
-                blocks.append(_bulleted(bullet))
+            blocks.append(_paragraph(f"{range_label} - {label}".strip(" -")))
+            blocks.extend(_bulleted_many(window.get("bullets", []) or []))
     else:
-        blocks.append(_bulleted("No timeline summary generated."))
+        blocks.append(_NO_TIMELINE)
 
-    blocks.append(_heading("Research requests"))
+    blocks.append(_HEADING_RESEARCH_REQUESTS)
     if research_requests:
-        for item in research_requests:
-            ts = item.get("ts", "")
-            speaker = item.get("speaker", "")
-            query = item.get("query", "")
-            blocks.append(_bulleted(f"[{ts}] {speaker}: {query}".strip()))
+        blocks.extend(
+            _bulleted(f"[{item.get('ts', '')}] {item.get('speaker', '')}: {item.get('query', '')}".strip())
+            for item in research_requests
+        )
     else:
-        blocks.append(_bulleted("No research requests recorded."))
+        blocks.append(_NO_RESEARCH_REQUESTS)
 
-    blocks.append(_heading("Research results"))
+    blocks.append(_HEADING_RESEARCH_RESULTS)
     if research_results:
-        for item in research_results:
-            query = item.get("query", "")
-            blocks.append(_paragraph(query))
-            for res in item.get("results", []) or []:
-                title = res.get("title") or "Result"
-                url = res.get("url") or ""
-                snippet = res.get("snippet") or ""
-                line = f"{title} {url}".strip()
-                blocks.append(_bulleted(line))
-                if snippet:
-                    blocks.append(_paragraph(snippet))
+        blocks.extend(itertools.chain.from_iterable(map(_result_blocks, research_results)))
     else:
-        blocks.append(_bulleted("No research results available."))
+        blocks.append(_NO_RESEARCH_RESULTS)
 
-    blocks.append(_heading("Transcript"))
-    transcript_children = []
-    for part in chunk_text(transcript, max_chars=1800):
-        transcript_children.append(_paragraph(part))
+    blocks.append(_HEADING_TRANSCRIPT)
+    transcript_children = [_paragraph(part) for part in chunk_text(transcript, max_chars=1800)]
     blocks.append(_toggle("Full transcript (speaker-labelled)", transcript_children))
 
-    for chunk in _chunk_blocks(blocks, size=50):
-        notion.blocks.children.append(block_id=page_id, children=chunk)
+    # Appends to a single parent must stay sequential to preserve block order,
+    # so the first chunk rides along with page creation to save a round-trip.
+    chunks = _chunk_blocks(blocks, size=50)
+    first_chunk = next(chunks, [])
+    try:
+        page = notion.pages.create(
+            parent={"database_id": database_id},
+            properties=properties,
+            children=first_chunk,
+        )
+    except APIResponseError as exc:
+        # Only a rejected schema means the cache may be stale (e.g. a property was
+        # renamed); rate limits, missing objects etc. are not a schema problem.
+        if not from_cache or exc.code != APIErrorCode.ValidationError:
+            raise
+        # Refetch the schema and retry once.
+        _DB_SCHEMA_CACHE.pop(database_id, None)
+        db, _ = _get_database(notion, database_id)
+        page = notion.pages.create(
+            parent={"database_id": database_id},
+            properties=_page_properties(db.get("properties", {}), **page_props),
+            children=first_chunk,
+        )
+    page_id = page["id"]
+
+    append = notion.blocks.children.append
+    for chunk in chunks:
+        append(block_id=page_id, children=chunk)
 
     return page.get("url", "")
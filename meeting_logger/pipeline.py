@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import json
 import os
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern
 
 from dotenv import load_dotenv
 
@@ -19,12 +18,15 @@ from summariser.meeting_summariser import summarise_meeting, timeline_summary
 from notion.notion_uploader import upload_to_notion
 from utils.date_utils import determine_date, format_date
 from utils.chunking import group_segments_into_windows
+from utils.json_io import write_json
 from research.researcher import (
     extract_research_requests,
     normalize_trigger_text,
     run_research,
 )
 
+_BASE_DIR = Path(__file__).resolve().parent
+
 
 @dataclass
 class PipelineConfig:
@@ -47,6 +49,7 @@ class PipelineConfig:
     research_api_key: Optional[str] = None
     research_triggers: Optional[List[str]] = None
     research_verbs: Optional[List[str]] = None
+    research_command_re: Optional[Pattern[str]] = None
 
 
 def infer_meeting_type(title: str) -> Optional[str]:
@@ -72,97 +75,82 @@ def write_text(path: Path, text: str) -> None:
 
 
 def build_markdown(notes: Dict[str, Any], transcript: str, timeline: List[Dict[str, Any]]) -> str:
-    lines: List[str] = []
-    lines.append(f"# {notes.get('title', 'Meeting Notes')}")
-    lines.append("")
-    lines.append(f"Date: {notes.get('date', '')}")
+    lines: List[str] = [
+        f"# {notes.get('title', 'Meeting Notes')}",
+        "",
+        f"Date: {notes.get('date', '')}",
+    ]
     attendees = notes.get("attendees", [])
     if attendees:
         lines.append(f"Attendees: {', '.join(attendees)}")
     lines.append("")
 
-    def add_section(title: str, items: List[str]) -> None:
+    def add_section(title: str, items: Iterable[str], empty: bool) -> None:
         lines.append(f"## {title}")
-        if items:
-            for item in items:
-                lines.append(f"- {item}")
-        else:
+        if empty:
             lines.append("- None")
+        else:
+            lines.extend(items)
         lines.append("")
 
-    add_section("Summary", notes.get("summary", []))
-    add_section("Decisions", notes.get("decisions", []))
+    summary = notes.get("summary", [])
+    add_section("Summary", (f"- {item}" for item in summary), not summary)
+    decisions = notes.get("decisions", [])
+    add_section("Decisions", (f"- {item}" for item in decisions), not decisions)
 
-    lines.append("## Action items")
     actions = notes.get("actions", [])
-    if actions:
-        for action in actions:
-            owner = action.get("owner") or "Unassigned"
-            task = action.get("task") or ""
-            due = action.get("due") or ""
-            suffix = f" (due {due})" if due else ""
-            lines.append(f"- {owner}: {task}{suffix}")
-    else:
-        lines.append("- None")
-    lines.append("")
+    add_section(
+        "Action items",
+        (
+            f"- {action.get('owner') or 'Unassigned'}: {action.get('task') or ''}"
+            + (f" (due {action.get('due')})" if action.get("due") else "")
+            for action in actions
+        ),
+        not actions,
+    )
 
-    lines.append("## Top highlights")
     highlights = notes.get("highlights", [])
-    if highlights:
-        for item in highlights:
-            lines.append(f"- [{item.get('ts','')}] {item.get('text','')}")
-    else:
-        lines.append("- None")
-    lines.append("")
+    add_section(
+        "Top highlights",
+        (f"- [{item.get('ts','')}] {item.get('text','')}" for item in highlights),
+        not highlights,
+    )
 
     lines.append("## Timeline summary")
     if timeline:
         for window in timeline:
-            range_label = window.get("range", "")
-            label = window.get("label", "")
-            header = f"{range_label} - {label}".strip(" -")
+            header = f"{window.get('range', '')} - {window.get('label', '')}".strip(" -")
             lines.append(f"**{header}**")
-            for bullet in window.get("bullets", []) or []:
-                lines.append(f"- {bullet}")
+            lines.extend(f"- {bullet}" for bullet in window.get("bullets", []) or [])
             lines.append("")
     else:
-        lines.append("- None")
-        lines.append("")
+        lines.extend(("- None", ""))
 
-    lines.append("## Research requests")
     research_requests = notes.get("research_requests", [])
-    if research_requests:
-        for item in research_requests:
-            ts = item.get("ts", "")
-            speaker = item.get("speaker", "")
-            query = item.get("query", "")
-            lines.append(f"- [{ts}] {speaker}: {query}".strip())
-    else:
-        lines.append("- None")
-    lines.append("")
+    add_section(
+        "Research requests",
+        (
+            f"- [{item.get('ts', '')}] {item.get('speaker', '')}: {item.get('query', '')}".strip()
+            for item in research_requests
+        ),
+        not research_requests,
+    )
 
     lines.append("## Research results")
     research_results = notes.get("research_results", [])
     if research_results:
         for item in research_results:
-            query = item.get("query", "")
-            lines.append(f"**{query}**")
+            lines.append(f"**{item.get('query', '')}**")
             for res in item.get("results", []) or []:
-                title = res.get("title") or "Result"
-                url = res.get("url") or ""
+                lines.append(f"- {res.get('title') or 'Result'} {res.get('url') or ''}".strip())
                 snippet = res.get("snippet") or ""
-                lines.append(f"- {title} {url}".strip())
                 if snippet:
                     lines.append(f"  {snippet}")
             lines.append("")
     else:
-        lines.append("- None")
-        lines.append("")
+        lines.extend(("- None", ""))
 
-    lines.append("## Transcript")
-    lines.append("")
-    lines.append(transcript)
-    lines.append("")
+    lines.extend(("## Transcript", "", transcript, ""))
 
     return "\n".join(lines)
 
@@ -190,7 +178,9 @@ def run_pipeline(
     if config.notion_database_id:
         os.environ["NOTION_DATABASE_ID"] = config.notion_database_id
 
-    audio_dir = config.audio_dir.expanduser().resolve()
+    audio_dir = config.audio_dir
+    if not audio_dir.is_absolute():
+        audio_dir = audio_dir.expanduser().resolve()
     if not audio_dir.exists():
         raise FileNotFoundError(f"Audio directory not found: {audio_dir}")
 
@@ -200,9 +190,8 @@ def run_pipeline(
     date = determine_date(config.date_override, audio_dir)
     date_str = format_date(date)
 
-    base_dir = Path(__file__).resolve().parent
-    transcripts_dir = base_dir / "transcripts" / date_str
-    outputs_dir = base_dir / "outputs"
+    transcripts_dir = _BASE_DIR / "transcripts" / date_str
+    outputs_dir = _BASE_DIR / "outputs"
     transcripts_dir.mkdir(parents=True, exist_ok=True)
     outputs_dir.mkdir(parents=True, exist_ok=True)
 
@@ -269,19 +258,31 @@ def run_pipeline(
     if config.summarise:
         try:
             log("STATUS: Summarising")
-            notes.update(
-                summarise_meeting(
-                    transcript=normalized_transcript,
-                    attendees=attendees,
-                    date_str=date_str,
-                    meeting_title=meeting_title,
-                    model=model,
-                    fallback_model=fallback_model,
-                )
+            summary = summarise_meeting(
+                transcript=normalized_transcript,
+                attendees=attendees,
+                date_str=date_str,
+                meeting_title=meeting_title,
+                model=model,
+                fallback_model=fallback_model,
             )
+            # summarise_meeting returns the empty skeleton for very short transcripts.
+            if not any(summary[key] for key in ("summary", "decisions", "actions", "highlights")):
+                log("Summary is empty (transcript too short or nothing to summarise)")
+            notes.update(summary)
 
             windows = group_segments_into_windows(segments, config.chunk_minutes)
-            timeline = timeline_summary(windows, model=model, fallback_model=fallback_model)
+            failed_windows: List[str] = []
+            timeline = timeline_summary(
+                windows,
+                model=model,
+                fallback_model=fallback_model,
+                failures=failed_windows,
+            )
+            if failed_windows:
+                log(f"{len(failed_windows)} timeline windows failed: {'; '.join(failed_windows)}")
+            if windows and not timeline:
+                log("Timeline skipped: no transcript text in any window")
             notes["timeline"] = timeline
 
             if not meeting_title:
@@ -301,6 +302,7 @@ def run_pipeline(
         normalized_transcript,
         triggers=config.research_triggers,
         verbs=config.research_verbs,
+        command_re=config.research_command_re,
     )
     research_results = []
     if config.enable_research:
@@ -317,8 +319,7 @@ def run_pipeline(
     notes["research_results"] = research_results
 
     notes_path = outputs_dir / f"{date_str}_meeting_notes.json"
-    with notes_path.open("w", encoding="utf-8") as f:
-        json.dump(notes, f, ensure_ascii=False, indent=2)
+    write_json(notes_path, notes)
 
     md_path = outputs_dir / f"{date_str}_meeting_notes.md"
     write_text(md_path, build_markdown(notes, merged_text, timeline))
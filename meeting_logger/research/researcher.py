@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 DEFAULT_TRIGGERS = [
     "craig",
@@ -29,6 +32,17 @@ DEFAULT_VERBS = [
 ]
 
 
+# Common mishearings of the "craig" trigger word; all normalise to the same spelling.
+_TRIGGER_MISHEARINGS = ("quag", "crag", "graig", "craiq", "creg")
+_NORMALIZE_RE = re.compile(r"\b(?:" + "|".join(re.escape(k) for k in _TRIGGER_MISHEARINGS) + r")\b", re.IGNORECASE)
+
+RESEARCH_WORKERS = 8
+
+# Shared session so concurrent searches reuse pooled keep-alive connections.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+
 @dataclass
 class ResearchRequest:
     ts: str
@@ -38,62 +52,64 @@ class ResearchRequest:
 
 
 def normalize_trigger_text(text: str) -> str:
-    replacements = {
-        "quag": "craig",
-        "crag": "craig",
-        "graig": "craig",
-        "craiq": "craig",
-        "creg": "craig",
-    }
-    pattern = re.compile(r"\b(" + "|".join(re.escape(k) for k in replacements.keys()) + r")\b", re.IGNORECASE)
+    # A literal replacement keeps the substitution in C, with no per-match callback.
+    return _NORMALIZE_RE.sub("craig", text)
+
+
+def build_command_re(
+    triggers: Optional[List[str]] = None,
+    verbs: Optional[List[str]] = None,
+) -> Pattern[str]:
+    return _compile_command_re(tuple(triggers or DEFAULT_TRIGGERS), tuple(verbs or DEFAULT_VERBS))
 
-    def repl(match: re.Match) -> str:
-        key = match.group(1).lower()
-        return replacements.get(key, match.group(1))
 
-    return pattern.sub(repl, text)
+@functools.lru_cache(maxsize=8)
+def _compile_command_re(triggers: Tuple[str, ...], verbs: Tuple[str, ...]) -> Pattern[str]:
+    # Transcript line and command in one pattern, scanned over the whole transcript.
+    # Whitespace classes exclude "\n" so a match never spans lines.
+    trigger_pattern = "|".join(re.escape(t) for t in triggers)
+    verb_pattern = "|".join(re.escape(v) for v in verbs)
+    return re.compile(
+        r"^[^\S\n]*\[(?P<ts>\d{2}:\d{2}:\d{2})\][^\S\n]+(?P<speaker>[^:\n]+):[^\S\n]+.*?"
+        rf"\b(?P<trigger>{trigger_pattern})\b[^\S\n]*[,:\-]?[^\S\n]*(?P<verb>{verb_pattern})[^\S\n]+"
+        r"(?P<query>.+?)[^\S\n]*$",
+        re.IGNORECASE | re.MULTILINE,
+    )
 
 
 def extract_research_requests(
     transcript: str,
     triggers: Optional[List[str]] = None,
     verbs: Optional[List[str]] = None,
+    command_re: Optional[Pattern[str]] = None,
 ) -> List[ResearchRequest]:
+    # Callers pass the transcript through normalize_trigger_text once up front
+    # (run_pipeline does), so lines are not re-normalised here.
     if not transcript:
         return []
 
-    triggers = triggers or DEFAULT_TRIGGERS
-    verbs = verbs or DEFAULT_VERBS
-
-    trigger_pattern = "|".join(re.escape(t) for t in triggers)
-    verb_pattern = "|".join(re.escape(v) for v in verbs)
-    command_re = re.compile(
-        rf"\b(?P<trigger>{trigger_pattern})\b\s*[,:\-]?\s*(?P<verb>{verb_pattern})\s+(?P<query>.+)$",
-        re.IGNORECASE,
-    )
+    if command_re is None:
+        command_re = build_command_re(triggers, verbs)
 
     results: List[ResearchRequest] = []
-    line_re = re.compile(r"^\[(?P<ts>\d{2}:\d{2}:\d{2})\]\s+(?P<speaker>[^:]+):\s+(?P<text>.+)$")
 
-    for raw_line in transcript.splitlines():
-        match = line_re.match(raw_line.strip())
-        if not match:
-            continue
+    for match in command_re.finditer(transcript):
         ts = match.group("ts")
         speaker = match.group("speaker").strip()
-        text = normalize_trigger_text(match.group("text"))
-        cmd_match = command_re.search(text)
-        if not cmd_match:
-            continue
-        query = cmd_match.group("query").strip()
+        query = match.group("query").strip()
         if not query:
             continue
-        results.append(ResearchRequest(ts=ts, speaker=speaker, query=query, raw_line=raw_line))
+        results.append(ResearchRequest(ts=ts, speaker=speaker, query=query, raw_line=match.group(0)))
 
     return results
 
 
-def tavily_search(query: str, api_key: str, max_results: int = 5) -> List[Dict[str, Any]]:
+def tavily_search(
+    query: str,
+    api_key: str,
+    max_results: int = 5,
+    session: Optional[requests.Session] = None,
+) -> List[Dict[str, Any]]:
     url = "https://api.tavily.com/search"
     payload = {
         "api_key": api_key,
@@ -102,7 +118,7 @@ def tavily_search(query: str, api_key: str, max_results: int = 5) -> List[Dict[s
         "include_answer": False,
         "include_images": False,
     }
-    response = requests.post(url, json=payload, timeout=30)
+    response = (session or _SESSION).post(url, json=payload, timeout=30)
     response.raise_for_status()
     data = response.json()
     results = []
@@ -127,21 +143,25 @@ def run_research(
         return []
 
     provider = (provider or "none").lower()
-    results: List[Dict[str, Any]] = []
 
     if provider == "tavily":
         if not api_key:
             return []
-        for item in requests_list:
-            items = tavily_search(item.query, api_key=api_key, max_results=max_results)
-            results.append(
-                {
-                    "ts": item.ts,
-                    "speaker": item.speaker,
-                    "query": item.query,
-                    "results": items,
-                }
-            )
-        return results
+
+        def search(item: ResearchRequest) -> List[Dict[str, Any]]:
+            return tavily_search(item.query, api_key=api_key, max_results=max_results, session=_SESSION)
+
+        # map() yields in input order, so results line up with requests_list.
+        with ThreadPoolExecutor(max_workers=min(RESEARCH_WORKERS, len(requests_list))) as executor:
+            found = list(executor.map(search, requests_list))
+        return [
+            {
+                "ts": item.ts,
+                "speaker": item.speaker,
+                "query": item.query,
+                "results": items,
+            }
+            for item, items in zip(requests_list, found)
+        ]
 
     return []
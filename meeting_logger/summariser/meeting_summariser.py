@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-from typing import Any, Dict, List, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Transcripts shorter than this (after stripping) are not worth an LLM call.
+MIN_SUMMARY_CHARS = 200
+TIMELINE_WORKERS = 8
 
 
 def _get_openai_client():
@@ -17,8 +24,8 @@ def _get_openai_client():
     return OpenAI(api_key=api_key)
 
 
-def _call_openai_json(models: Sequence[str], system: str, user: str) -> Dict[str, Any]:
-    client = _get_openai_client()
+def _call_openai_json(models: Sequence[str], system: str, user: str, client=None) -> Dict[str, Any]:
+    client = client or _get_openai_client()
 
     last_exc: Exception | None = None
     for model in models:
@@ -42,6 +49,37 @@ def _call_openai_json(models: Sequence[str], system: str, user: str) -> Dict[str
     raise last_exc or RuntimeError("OpenAI call failed")
 
 
+def _llm_cache_dir() -> Optional[Path]:
+    if os.getenv("MEETING_LOGGER_LLM_CACHE", "1").strip().lower() in ("0", "false", "no", "off"):
+        return None
+    return Path.home() / ".cache" / "meeting_logger" / "llm"
+
+
+def _cached_call_openai_json(models: Sequence[str], system: str, user: str, client=None) -> Dict[str, Any]:
+    cache_dir = _llm_cache_dir()
+    if cache_dir is None:
+        return _call_openai_json(models=models, system=system, user=user, client=client)
+
+    key = hashlib.sha256("\0".join([*models, system, user]).encode("utf-8")).hexdigest()
+    path = cache_dir / f"{key}.json"
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    data = _call_openai_json(models=models, system=system, user=user, client=client)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Caching is best-effort; the fresh response is still returned.
+    return data
+
+
 def _safe_list(value: Any) -> List[Any]:
     if isinstance(value, list):
         return value
@@ -56,6 +94,9 @@ def summarise_meeting(
     model: str,
     fallback_model: Optional[str] = None,
 ) -> Dict[str, Any]:
+    if len(transcript.strip()) < MIN_SUMMARY_CHARS:
+        return _notes_from_response({}, meeting_title)
+
     title_hint = meeting_title or ""
 
     system = (
@@ -95,8 +136,11 @@ def summarise_meeting(
     models = [model]
     if fallback_model and fallback_model not in models:
         models.append(fallback_model)
-    data = _call_openai_json(models=models, system=system, user=user)
+    data = _cached_call_openai_json(models=models, system=system, user=user)
+    return _notes_from_response(data, meeting_title)
+
 
+def _notes_from_response(data: Dict[str, Any], meeting_title: Optional[str]) -> Dict[str, Any]:
     return {
         "title": data.get("title") or (meeting_title or "Team Sync"),
         "topics": _safe_list(data.get("topics")),
@@ -113,7 +157,11 @@ def timeline_summary(
     windows: List[Dict[str, Any]],
     model: str,
     fallback_model: Optional[str] = None,
+    failures: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
+    # Windows whose request fails are kept with an empty label and bullets, and a
+    # "range: error" line is appended to failures. If every window fails, the first
+    # error is raised.
     if not windows:
         return []
 
@@ -130,27 +178,50 @@ def timeline_summary(
             text = seg.get("text", "").strip()
             if text:
                 text_lines.append(f"{speaker}: {text}")
-        window_payload.append({
-            "range": win.get("range"),
-            "text": "\n".join(text_lines),
-        })
-
-    user = (
-        "Summarise each time window into a short chapter label and 3-6 bullets.\n\n"
-        "Return JSON:\n"
-        "{\n"
-        "  \"timeline\": [\n"
-        "    {\"range\": string, \"label\": string, \"bullets\": [string]}\n"
-        "  ]\n"
-        "}\n\n"
-        "Rules:\n"
-        "- Keep labels short and descriptive.\n"
-        "- Bullets must be grounded in the text.\n\n"
-        f"Windows:\n{json.dumps(window_payload, ensure_ascii=False)}"
-    )
+        if text_lines:
+            window_payload.append({
+                "range": win.get("range"),
+                "text": "\n".join(text_lines),
+            })
+    if not window_payload:
+        return []
 
     models = [model]
     if fallback_model and fallback_model not in models:
         models.append(fallback_model)
-    data = _call_openai_json(models=models, system=system, user=user)
-    return _safe_list(data.get("timeline"))
+
+    # One request per window: they run concurrently over a shared client, and each
+    # prompt is cached on its own so a re-run only re-summarises changed windows.
+    client = _get_openai_client()
+
+    def summarise_window(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Exception]]:
+        user = (
+            "Summarise this time window into a short chapter label and 3-6 bullets.\n\n"
+            "Return JSON:\n"
+            "{\"label\": string, \"bullets\": [string]}\n\n"
+            "Rules:\n"
+            "- Keep the label short and descriptive.\n"
+            "- Bullets must be grounded in the text.\n\n"
+            f"Window {payload['range']}:\n{payload['text']}"
+        )
+        error: Optional[Exception] = None
+        try:
+            data = _cached_call_openai_json(models=models, system=system, user=user, client=client)
+        except Exception as exc:
+            data, error = {}, exc
+        entry = {
+            "range": payload["range"],
+            "label": data.get("label") or "",
+            "bullets": _safe_list(data.get("bullets")),
+        }
+        return entry, error
+
+    with ThreadPoolExecutor(max_workers=min(TIMELINE_WORKERS, len(window_payload))) as executor:
+        outcomes = list(executor.map(summarise_window, window_payload))
+
+    errors = [(entry["range"], error) for entry, error in outcomes if error is not None]
+    if len(errors) == len(outcomes):
+        raise errors[0][1]
+    if failures is not None:
+        failures.extend(f"{range_label}: {error}" for range_label, error in errors)
+    return [entry for entry, _error in outcomes]
@@ -1,17 +1,29 @@
 from __future__ import annotations
 
-import json
+import os
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable, List, Dict, Any, Optional, Callable
+from typing import Iterable, List, Dict, Any, Optional, Callable, Tuple, Union
 
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.audio import decode_audio
+from faster_whisper.vad import VadOptions, get_speech_timestamps
 
 from utils.chunking import format_timestamp
+from utils.json_io import write_json_array
 
 SUPPORTED_EXTS = {".wav", ".mp3", ".m4a", ".flac", ".ogg", ".opus"}
+GPU_BATCH_SIZE = 16
+SAMPLE_RATE = 16000
+# Same VAD settings BatchedInferencePipeline applies itself when vad_filter=True.
+BATCH_VAD_OPTIONS = VadOptions(max_speech_duration_s=30, min_silence_duration_ms=160)
 
 
 @dataclass
@@ -22,16 +34,26 @@ class TranscriptionResult:
 
 
 def list_audio_files(audio_dir: Path) -> List[Path]:
-    return sorted(
-        [p for p in audio_dir.iterdir() if p.is_file() and p.suffix.lower() in SUPPORTED_EXTS]
-    )
+    with os.scandir(audio_dir) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTS and entry.is_file()
+        )
 
 
 def normalize_audio(input_path: Path, work_dir: Path) -> Path:
-    output_path = work_dir / f"{input_path.stem}_16k.wav"
+    # Full file name, not stem: tracks are normalised concurrently and bob.flac and
+    # bob.m4a must not share an output.
+    output_path = work_dir / f"{input_path.name}_16k.wav"
     cmd = [
         "ffmpeg",
         "-y",
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-threads",
+        "1",
         "-i",
         str(input_path),
         "-ar",
@@ -42,7 +64,7 @@ def normalize_audio(input_path: Path, work_dir: Path) -> Path:
         "pcm_s16le",
         str(output_path),
     ]
-    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
     return output_path
 
 
@@ -65,22 +87,55 @@ def get_duration_seconds(audio_path: Path) -> Optional[float]:
         return None
 
 
+def _speech_clips(audio_path: Path) -> List[Dict[str, float]]:
+    audio = decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE)
+    speech = get_speech_timestamps(audio, BATCH_VAD_OPTIONS, sampling_rate=SAMPLE_RATE)
+    del audio
+
+    # Raw speech spans, as vad_filter=True hands them over internally: the batched
+    # pipeline's collect_chunks packs them into <=30s chunks of speech samples only.
+    return [{"start": span["start"] / SAMPLE_RATE, "end": span["end"] / SAMPLE_RATE} for span in speech]
+
+
+def _prepare_audio(
+    input_path: Path,
+    work_dir: Path,
+    vad_slot: Optional[threading.Semaphore] = None,
+) -> Tuple[Path, Optional[float], Optional[List[Dict[str, float]]]]:
+    normalized = normalize_audio(input_path, work_dir)
+    clips: Optional[List[Dict[str, float]]] = None
+    if vad_slot is not None:
+        # VAD needs the whole track decoded to float32; one at a time keeps that bounded.
+        with vad_slot:
+            clips = _speech_clips(normalized)
+    return normalized, get_duration_seconds(normalized), clips
+
+
+# Loaded models stay in RAM/VRAM for the life of the process so repeated runs skip
+# the load; call load_model.cache_clear() to release them.
+@lru_cache(maxsize=4)
 def load_model(model_name: str, device: str, compute_type: str) -> WhisperModel:
     return WhisperModel(model_name, device=device, compute_type=compute_type)
 
 
 def transcribe_file(
-    model: WhisperModel,
+    model: Union[WhisperModel, BatchedInferencePipeline],
     audio_path: Path,
     speaker: str,
     language: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    clip_timestamps: Optional[List[Dict[str, float]]] = None,
 ) -> TranscriptionResult:
-    segments_iter, _info = model.transcribe(
-        str(audio_path),
-        beam_size=5,
-        language=language,
-        vad_filter=True,
-    )
+    options: Dict[str, Any] = {"beam_size": 5, "language": language, "vad_filter": True}
+    if batch_size:
+        options["batch_size"] = batch_size
+    if clip_timestamps is not None:
+        if not clip_timestamps:
+            return TranscriptionResult(speaker=speaker, segments=[], text="")
+        # VAD already ran while the audio was prepared; only decode the speech clips.
+        options["vad_filter"] = False
+        options["clip_timestamps"] = clip_timestamps
+    segments_iter, _info = model.transcribe(str(audio_path), **options)
 
     segments: List[Dict[str, Any]] = []
     lines: List[str] = []
@@ -118,18 +173,41 @@ def transcribe_directory(
     if not audio_files:
         return results
 
-    model = load_model(model_name, device, compute_type)
-
-    with tempfile.TemporaryDirectory() as tmp:
+    # ffmpeg runs out-of-process, so threads give real overlap: every track is
+    # normalized concurrently while the model loads. On GPU the Silero VAD pass
+    # runs in the same workers so it stays off the batched decoder's critical path.
+    batched = device != "cpu"
+    vad_slot = threading.Semaphore(1) if batched else None
+    workers = min(len(audio_files), os.cpu_count() or 1) + 1
+    with tempfile.TemporaryDirectory() as tmp, ThreadPoolExecutor(max_workers=workers) as executor:
         tmp_dir = Path(tmp)
+        model_future = executor.submit(load_model, model_name, device, compute_type)
+        prepared = [
+            executor.submit(_prepare_audio, audio_path, tmp_dir, vad_slot) for audio_path in audio_files
+        ]
+
+        model: Union[WhisperModel, BatchedInferencePipeline] = model_future.result()
+        batch_size: Optional[int] = None
+        if batched:
+            # Decode each file's VAD chunks in GPU batches; CPU stays on the sequential decoder.
+            model = BatchedInferencePipeline(model=model)
+            batch_size = GPU_BATCH_SIZE
+
         total = len(audio_files)
-        for idx, audio_path in enumerate(audio_files, start=1):
+        for idx, (audio_path, future) in enumerate(zip(audio_files, prepared), start=1):
             if cancel_cb and cancel_cb():
+                executor.shutdown(cancel_futures=True)
                 break
             speaker = audio_path.stem
-            normalized = normalize_audio(audio_path, tmp_dir)
-            duration = get_duration_seconds(normalized)
-            result = transcribe_file(model, normalized, speaker, language=language)
+            normalized, duration, clips = future.result()
+            result = transcribe_file(
+                model,
+                normalized,
+                speaker,
+                language=language,
+                batch_size=batch_size,
+                clip_timestamps=clips,
+            )
             results.append(result)
             if progress_cb:
                 progress_cb(idx, total, speaker, duration)
@@ -138,10 +216,9 @@ def transcribe_directory(
 
 
 def merge_segments(results: Iterable[TranscriptionResult]) -> List[Dict[str, Any]]:
-    merged: List[Dict[str, Any]] = []
-    for result in results:
-        merged.extend(result.segments)
-    merged.sort(key=lambda s: (s.get("start", 0), s.get("speaker", "")))
+    # transcribe_file always sets "start" and "speaker" on every segment.
+    merged = list(chain.from_iterable(result.segments for result in results))
+    merged.sort(key=itemgetter("start", "speaker"))
     return merged
 
 
@@ -158,5 +235,4 @@ def merged_transcript_text(segments: Iterable[Dict[str, Any]]) -> str:
 
 
 def save_segments_json(path: Path, segments: List[Dict[str, Any]]) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(segments, f, ensure_ascii=False, indent=2)
+    write_json_array(path, segments)
@@ -1,61 +1,56 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Dict, Any
+from functools import lru_cache
+from itertools import groupby
+from typing import Iterable, Iterator, List, Dict, Any
 
 
 def format_timestamp(seconds: float, always_hours: bool = True) -> str:
-    total = max(0, int(seconds))
-    h = total // 3600
-    m = (total % 3600) // 60
-    s = total % 60
-    if always_hours or h > 0:
+    return _format_whole_seconds(max(0, int(seconds)), always_hours)
+
+
+# Segments in a meeting share a few thousand distinct whole-second starts.
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(total: int, always_hours: bool) -> str:
+    h, rem = divmod(total, 3600)
+    m, s = divmod(rem, 60)
+    if always_hours or h:
         return f"{h:02d}:{m:02d}:{s:02d}"
     return f"{m:02d}:{s:02d}"
 
 
-def chunk_text(text: str, max_chars: int = 1800) -> List[str]:
+def chunk_text(text: str, max_chars: int = 1800) -> Iterator[str]:
     if not text:
-        return []
+        return
 
-    parts: List[str] = []
     for paragraph in text.split("\n"):
         para = paragraph.strip()
         if not para:
             continue
-        while len(para) > max_chars:
-            parts.append(para[:max_chars])
-            para = para[max_chars:]
-        parts.append(para)
-
-    if not parts:
-        return []
-
-    return parts
+        # Index windows rather than re-slicing the remainder each pass.
+        for start in range(0, len(para), max_chars):
+            yield para[start:start + max_chars]
 
 
 def group_segments_into_windows(
     segments: Iterable[Dict[str, Any]],
     chunk_minutes: int,
 ) -> List[Dict[str, Any]]:
-    window_seconds = max(1, int(chunk_minutes)) * 60
-    windows: Dict[int, List[Dict[str, Any]]] = {}
-
-    for seg in segments:
-        start = float(seg.get("start", 0))
-        window_index = int(start // window_seconds)
-        windows.setdefault(window_index, []).append(seg)
+    # Segments must already be sorted by start time (merge_segments does this),
+    # so each window is one contiguous run.
+    window_seconds = float(max(1, int(chunk_minutes)) * 60)
 
-    if not windows:
-        return []
+    def window_index(seg: Dict[str, Any]) -> int:
+        return int(float(seg.get("start", 0)) // window_seconds)
 
     results: List[Dict[str, Any]] = []
-    for index in sorted(windows.keys()):
-        start = index * window_seconds
-        end = (index + 1) * window_seconds
+    for index, group in groupby(segments, key=window_index):
+        start = int(index * window_seconds)
+        end = int((index + 1) * window_seconds)
         range_label = f"{format_timestamp(start, always_hours=False)}-{format_timestamp(end, always_hours=False)}"
         results.append({
             "range": range_label,
-            "segments": windows[index],
+            "segments": list(group),
         })
 
     return results
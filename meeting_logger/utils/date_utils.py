@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import re
 from datetime import datetime, date
 from pathlib import Path
@@ -32,12 +33,9 @@ def determine_date(cli_date: Optional[str], audio_dir: Path) -> date:
     if folder_date:
         return folder_date
 
-    latest_mtime = None
-    for p in audio_dir.iterdir():
-        if p.is_file():
-            mtime = p.stat().st_mtime
-            if latest_mtime is None or mtime > latest_mtime:
-                latest_mtime = mtime
+    # scandir reuses the directory listing's file-type info instead of a stat per Path.
+    with os.scandir(audio_dir) as entries:
+        latest_mtime = max((entry.stat().st_mtime for entry in entries if entry.is_file()), default=None)
 
     if latest_mtime is None:
         return datetime.now().date()
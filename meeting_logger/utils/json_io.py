@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def write_json(path: Path, data: Any) -> None:
+    # orjson always emits unescaped UTF-8, matching ensure_ascii=False below.
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def write_json_array(path: Path, items: Iterable[Any]) -> None:
+    # One element per line, serialised as it is written, so the whole document
+    # is never held in memory at once.
+    with path.open("wb") as f:
+        f.write(b"[")
+        separator = b"\n  "
+        for item in items:
+            f.write(separator)
+            f.write(_dumps_compact(item))
+            separator = b",\n  "
+        if separator != b"\n  ":
+            f.write(b"\n")
+        f.write(b"]")
+
+
+def _dumps_compact(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")